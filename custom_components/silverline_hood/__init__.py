@@ -2,22 +2,173 @@
 import asyncio
 import json
 import logging
+import socket
 from datetime import timedelta
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import voluptuous as vol
 
-from .const import DOMAIN
+from .const import (
+    CACHED_ADDRESS_TIMEOUT,
+    CMD_LINE_ENDING,
+    COMMAND_DEBOUNCE,
+    CONF_UPDATE_INTERVAL,
+    CONNECTION_IDLE_TIMEOUT,
+    CONNECTION_KEEPALIVE,
+    CONNECTION_TIMEOUT,
+    DEFAULT_UPDATE_INTERVAL,
+    DEVICE_IDENTIFIER,
+    DOMAIN,
+    HOST_RESOLVE_TTL,
+    STATUS_QUERY,
+)
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:  # pragma: no cover
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _loads(data: bytes) -> Any:
+        """Parse a JSON reply frame.
+
+        Like orjson, rejects trailing data and raises a ValueError for
+        anything that is not valid UTF-8 JSON.
+        """
+        return json.loads(data)
+
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["fan", "light", "sensor"]
 
+_LINE_END = CMD_LINE_ENDING.encode()
+_STATUS_QUERY_BYTES = _dumps(STATUS_QUERY) + _LINE_END
+_BANNER = DEVICE_IDENTIFIER.encode()
+
+# State keys sent in a full control command, in wire order
+_WIRE_KEYS = ("M", "L", "R", "G", "B", "CW", "BRG", "T", "TM")
+
+# Sent with every control command, changed or not.
+# KORRIGIERT: App-konforme Werte für Control-Befehle!
+_CONTROL_VALUES: Mapping[str, int] = MappingProxyType({
+    "TS": 255,  # IMMER 255 wie in der App!
+    "A": 1,     # IMMER 1 für Control-Befehle (nicht 4!)
+})
+_CONTROL_FLAGS = tuple(_CONTROL_VALUES)
+_LINE_BREAKS = b"\r\n"
+
+# State assumed until the hood has reported its own
+_DEFAULT_STATE: Mapping[str, Any] = MappingProxyType({
+    "M": 1, "L": 1, "R": 45, "G": 255, "B": 104,
+    "CW": 110, "BRG": 132, "T": 0, "TM": 0, "TS": 0,
+    "A": 1, "LM": 0, "CWD": 0, "RGBD": 0
+})
+
+# Changes sent by send_exact_command, by command type
+_EXACT_COMMANDS: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    "light_on": {"L": 2},
+    "light_off": {"L": 1},
+    "fan_off": {"M": 1},
+    "fan_speed_1": {"M": 2},
+    "fan_speed_2": {"M": 3},
+    "fan_speed_3": {"M": 4},
+    "fan_speed_4": {"M": 5},
+})
+
+# Command types accepted by send_exact_commands
+_COMMAND_TYPES = frozenset(_EXACT_COMMANDS) | {"status_query"}
+
+# Service schemas, shared by every entry
+_TEST_COMMAND_SCHEMA = vol.Schema({
+    # One command type or a list of them, sent together
+    vol.Required("command_type", default="status_query"): vol.All(
+        cv.ensure_list, [vol.In(_COMMAND_TYPES)]
+    ),
+    vol.Optional("entry_id"): cv.string,
+})
+
+_RAW_BYTES_SCHEMA = vol.Schema({
+    vol.Required("command", default='{"A":4}'): cv.string,
+    vol.Optional("entry_id"): cv.string,
+})
+
+# Fixed test services: log label, coordinator method and changes sent
+_TEST_SERVICES: Mapping[str, Tuple[str, str, Mapping[str, int]]] = MappingProxyType({
+    "test_light_on": ("Light ON", "send_smart_command", {"L": 2}),
+    "test_light_off": ("Light OFF", "send_smart_command", {"L": 1}),
+    "test_fan_on": ("Fan ON", "send_smart_command", {"M": 2}),
+    "test_fan_off": ("Fan OFF", "send_smart_command", {"M": 1}),
+    "test_minimal": ("Minimal command", "send_minimal_command", {"L": 2}),
+    "test_full": ("Full command", "send_smart_command", {"L": 2}),
+})
+
+# Encoded payloads kept per coordinator before the cache is reset
+_PAYLOAD_CACHE_SIZE = 64
+
+
+def _split_frame(buffer: bytearray) -> Optional[bytes]:
+    """Remove and return the first complete reply frame in buffer.
+
+    A frame is a JSON object, tracked by brace depth so it is complete as
+    soon as its closing brace arrives, or a plain text line for non-JSON
+    replies. Line endings and the banner in front of it are discarded.
+    Returns None if no complete frame has arrived yet.
+    """
+    start = None
+    line_start = 0
+    depth = 0
+    in_string = escaped = False
+
+    for index, byte in enumerate(buffer):
+        if start is None:
+            if byte == 0x7B:  # {
+                start = index
+                depth = 1
+            elif byte in _LINE_BREAKS:
+                text = bytes(buffer[line_start:index]).strip()
+                line_start = index + 1
+                if text and text != _BANNER:
+                    del buffer[:line_start]
+                    return text
+        elif in_string:
+            if escaped:
+                escaped = False
+            elif byte == 0x5C:  # backslash
+                escaped = True
+            elif byte == 0x22:  # "
+                in_string = False
+        elif byte == 0x22:
+            in_string = True
+        elif byte == 0x7B:
+            depth += 1
+        elif byte == 0x7D:  # }
+            depth -= 1
+            if depth == 0:
+                frame = bytes(buffer[start:index + 1])
+                del buffer[:index + 1]
+                return frame
+
+    return None
+
+
+def _is_echo(sent: Mapping[str, Any], reply: Optional[Mapping[str, Any]]) -> bool:
+    """Return True if reply reports every value sent, control flags aside."""
+    return reply is not None and all(
+        reply.get(key) == value
+        for key, value in sent.items()
+        if key not in _CONTROL_FLAGS
+    )
+
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Silverline Hood component."""
@@ -28,11 +179,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Silverline Hood from a config entry."""
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
+    # Host and port make up the entity unique_ids, only the interval is an option
+    update_interval = entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
 
-    coordinator = SilverlineHoodCoordinator(hass, host, port)
+    coordinator = SilverlineHoodCoordinator(hass, host, port, update_interval)
     
     # Initial data fetch
     await coordinator.async_config_entry_first_refresh()
+
+    # Stop polling and close the connection when Home Assistant stops
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, coordinator.async_stop)
+    )
+    
+    # Rebuild the coordinator with the new settings when options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -43,405 +204,678 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register services
     await _register_services(hass)
     
-    _LOGGER.info("Silverline Hood integration setup completed")
+    _LOGGER.debug("Silverline Hood integration setup completed")
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # Remove services
-    services_to_remove = [
-        "test_exact_command", "send_raw_bytes", "query_status",
-        "test_light_on", "test_light_off", "test_fan_on", "test_fan_off",
-        "test_minimal", "test_full"
-    ]
-    
-    for service in services_to_remove:
-        if hass.services.has_service(DOMAIN, service):
-            hass.services.async_remove(DOMAIN, service)
-    
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+
+    # Services are shared, only remove them with the last entry
+    if not hass.data.get(DOMAIN):
+        services_to_remove = [
+            "test_exact_command", "send_raw_bytes", "query_status",
+            *_TEST_SERVICES,
+        ]
+        
+        for service in services_to_remove:
+            if hass.services.has_service(DOMAIN, service):
+                hass.services.async_remove(DOMAIN, service)
     
     return unload_ok
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> Optional["SilverlineHoodCoordinator"]:
+    """Return the coordinator a service call is meant for.
+
+    Calls may pick an entry with entry_id, otherwise the first one is used.
+    Raises ServiceValidationError if entry_id names no loaded entry.
+    """
+    coordinators = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get("entry_id")
+    if entry_id is None:
+        return next(iter(coordinators.values()), None)
+    if entry_id not in coordinators:
+        raise ServiceValidationError(
+            f"No loaded Silverline Hood entry with entry_id {entry_id!r}"
+        )
+    return coordinators[entry_id]
+
+
 async def _register_services(hass: HomeAssistant):
-    """Register services."""
+    """Register services, once for all entries."""
+    if hass.services.has_service(DOMAIN, "test_exact_command"):
+        return
     
     async def handle_test_exact_command(call: ServiceCall):
         """Handle test exact command service."""
         command_type = call.data.get("command_type", "status_query")
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
+        coordinator = _get_coordinator(hass, call)
         if coordinator:
-            result = await coordinator.send_exact_command(command_type)
-            _LOGGER.info("Service test_exact_command result: %s", result)
+            result = await coordinator.send_exact_commands(command_type)
+            _LOGGER.debug("Service test_exact_command result: %s", result)
 
     async def handle_send_raw_bytes(call: ServiceCall):
         """Handle send raw bytes service."""
         command = call.data.get("command", '{"A":4}')
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
+        coordinator = _get_coordinator(hass, call)
         if coordinator:
-            # Add \r if not present
-            if not command.endswith('\r'):
-                command += '\r'
             result = await coordinator.send_raw_command(command)
-            _LOGGER.info("Service send_raw_bytes result: %s", result)
+            _LOGGER.debug("Service send_raw_bytes result: %s", result)
 
     async def handle_query_status(call: ServiceCall):
         """Handle query status service."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
+        coordinator = _get_coordinator(hass, call)
         if coordinator:
             await coordinator.async_request_refresh()
-            _LOGGER.info("Status refresh requested")
+            _LOGGER.debug("Status refresh requested")
 
-    async def handle_test_light_on(call: ServiceCall):
-        """Test light on directly."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING LIGHT ON ===")
-            result = await coordinator.send_smart_command({"L": 2})
-            _LOGGER.info("Light ON result: %s", result)
-
-    async def handle_test_light_off(call: ServiceCall):
-        """Test light off directly."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING LIGHT OFF ===")
-            result = await coordinator.send_smart_command({"L": 1})
-            _LOGGER.info("Light OFF result: %s", result)
-
-    async def handle_test_fan_on(call: ServiceCall):
-        """Test fan on directly."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING FAN ON ===")
-            result = await coordinator.send_smart_command({"M": 2})
-            _LOGGER.info("Fan ON result: %s", result)
-
-    async def handle_test_fan_off(call: ServiceCall):
-        """Test fan off directly."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING FAN OFF ===")
-            result = await coordinator.send_smart_command({"M": 1})
-            _LOGGER.info("Fan OFF result: %s", result)
+    def make_test_handler(label: str, method: str, changes: Mapping[str, int]):
+        """Build a handler sending fixed changes with a coordinator method."""
+        banner = label.upper()
 
-    async def handle_test_minimal(call: ServiceCall):
-        """Test minimal command."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING MINIMAL COMMAND ===")
-            result = await coordinator.send_minimal_command({"L": 2})
-            _LOGGER.info("Minimal command result: %s", result)
+        async def handle_test(call: ServiceCall):
+            """Send a fixed test command."""
+            coordinator = _get_coordinator(hass, call)
+            if coordinator:
+                _LOGGER.debug("=== TESTING %s ===", banner)
+                result = await getattr(coordinator, method)(dict(changes))
+                _LOGGER.debug("%s result: %s", label, result)
 
-    async def handle_test_full(call: ServiceCall):
-        """Test full command."""
-        coordinator = next(iter(hass.data[DOMAIN].values()), None)
-        if coordinator:
-            _LOGGER.info("=== TESTING FULL COMMAND ===")
-            result = await coordinator.send_smart_command({"L": 2})
-            _LOGGER.info("Full command result: %s", result)
-
-    # Service schemas
-    test_command_schema = vol.Schema({
-        vol.Required("command_type", default="status_query"): vol.In([
-            "light_on", "light_off", "fan_speed_1", "fan_speed_2", 
-            "fan_speed_3", "fan_speed_4", "fan_off", "status_query"
-        ])
-    })
-
-    raw_bytes_schema = vol.Schema({
-        vol.Required("command", default='{"A":4}'): cv.string
-    })
+        return handle_test
 
     # Register services
-    hass.services.async_register(DOMAIN, "test_exact_command", handle_test_exact_command, schema=test_command_schema)
-    hass.services.async_register(DOMAIN, "send_raw_bytes", handle_send_raw_bytes, schema=raw_bytes_schema)
+    hass.services.async_register(DOMAIN, "test_exact_command", handle_test_exact_command, schema=_TEST_COMMAND_SCHEMA)
+    hass.services.async_register(DOMAIN, "send_raw_bytes", handle_send_raw_bytes, schema=_RAW_BYTES_SCHEMA)
     hass.services.async_register(DOMAIN, "query_status", handle_query_status)
-    hass.services.async_register(DOMAIN, "test_light_on", handle_test_light_on)
-    hass.services.async_register(DOMAIN, "test_light_off", handle_test_light_off)
-    hass.services.async_register(DOMAIN, "test_fan_on", handle_test_fan_on)
-    hass.services.async_register(DOMAIN, "test_fan_off", handle_test_fan_off)
-    hass.services.async_register(DOMAIN, "test_minimal", handle_test_minimal)
-    hass.services.async_register(DOMAIN, "test_full", handle_test_full)
+    for service, (label, method, changes) in _TEST_SERVICES.items():
+        hass.services.async_register(
+            DOMAIN, service, make_test_handler(label, method, changes)
+        )
 
-    _LOGGER.info("All Silverline Hood services registered")
+    _LOGGER.debug("All Silverline Hood services registered")
 
 
 class SilverlineHoodCoordinator(DataUpdateCoordinator):
     """Coordinator with regular status updates."""
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        update_interval: int = DEFAULT_UPDATE_INTERVAL,
+    ):
         """Initialize the coordinator."""
         self.host = host
         self.port = port
-        self._last_state = {
-            "M": 1, "L": 1, "R": 45, "G": 255, "B": 104, 
-            "CW": 110, "BRG": 132, "T": 0, "TM": 0, "TS": 0,
-            "A": 1, "LM": 0, "CWD": 0, "RGBD": 0
+        self._last_state = dict(_DEFAULT_STATE)
+
+        # One device entry, shared by all entities of this hood
+        self.device_id = f"{host}_{port}"
+        self.device_info = {
+            "identifiers": {(DOMAIN, self.device_id)},
+            "name": "Silverline Hood",
+            "manufacturer": "Silverline",
+            "model": "Smart Hood",
         }
+
+        # Read-only view handed out by current_state
+        self._state_view_source: Optional[Dict[str, Any]] = None
+        self._state_view: Mapping[str, Any] = MappingProxyType(self._last_state)
+
+        # Persistent connection, shared by polling and commands
+        self._conn_lock = asyncio.Lock()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._rx_buffer = bytearray()
+        self._idle_unsub: Optional[Callable[[], None]] = None
+        self._peername: Optional[Tuple[Any, ...]] = None
+        self._peername_at = 0.0
+
+        # Debounced smart commands
+        self._pending: Dict[str, Any] = {}
+        self._send_task: Optional[asyncio.Task] = None
+
+        # Status query in flight, shared by concurrent refreshes
+        self._status_task: Optional[asyncio.Task] = None
+
+        # Set once Home Assistant stops or the entry is unloaded
+        self._shutting_down = False
+
+        # Whether the hood accepts partial commands. Only probed once it has
+        # echoed a full command, a silent hood always gets the full state
+        self._supports_delta: Optional[bool] = None
+        self._echoes_state = False
+        self._state_fragments: Dict[str, Tuple[Any, bytes]] = {}
+        self._payload_cache: Dict[Tuple[Tuple[str, Any], ...], bytes] = {}
+        # Fixed commands go out as deltas, encode those up front
+        for changes in _EXACT_COMMANDS.values():
+            self._encode_state({**changes, **_CONTROL_VALUES})
         
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),  # Update alle 10 Sekunden
+            update_interval=timedelta(seconds=update_interval),
+            # Only notify listeners when the polled state actually changed
+            always_update=False,
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from the hood."""
+        if self._shutting_down:
+            return dict(self._last_state)
         try:
             return await self._query_current_status()
         except Exception as ex:
             # Don't fail on update errors, return last known state
             _LOGGER.debug("Status update failed: %s", ex)
-            return self._last_state
+            return dict(self._last_state)
+
+    async def _ensure_connection(
+        self,
+    ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Return the persistent connection, opening it if needed.
+
+        Must be called with ``_conn_lock`` held.
+        """
+        if (
+            self._writer is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        ):
+            return self._reader, self._writer
+
+        self._close_connection()
+        if self._shutting_down:
+            raise ConnectionAbortedError("Coordinator is shutting down")
+
+        _LOGGER.debug("Opening connection to %s:%s", self.host, self.port)
+        if (
+            self._peername is not None
+            and self.hass.loop.time() - self._peername_at > HOST_RESOLVE_TTL
+        ):
+            # Pick up DNS changes now and then
+            self._peername = None
+        if self._peername is None:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        else:
+            # Reconnect to the address seen last time, a numeric
+            # address lets asyncio skip getaddrinfo entirely
+            try:
+                # Short on its own, a dead address must not use up the
+                # whole connect budget before the name is resolved again
+                async with asyncio.timeout(CACHED_ADDRESS_TIMEOUT):
+                    reader, writer = await asyncio.open_connection(*self._peername[:2])
+            except (OSError, TimeoutError):
+                # The hood may have a new address, resolve its name again
+                self._peername = None
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+        if self._peername is None:
+            self._peername = writer.get_extra_info("peername")
+            self._peername_at = self.hass.loop.time()
+
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            # Commands are single short lines, don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Let the kernel notice a hood that dropped off the network
+            # while the connection sits idle between polls
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # The kernel default only starts probing after two hours
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, CONNECTION_KEEPALIVE)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, CONNECTION_KEEPALIVE)
+
+        # No need to wait for the initial "okidargb", _split_frame skips it
+        self._reader, self._writer = reader, writer
+        return reader, writer
+
+    def _close_connection(self) -> None:
+        """Drop the persistent connection so the next call reconnects."""
+        if self._idle_unsub is not None:
+            self._idle_unsub()
+            self._idle_unsub = None
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        self._rx_buffer.clear()
+
+    @callback
+    def _handle_idle_timeout(self, _now) -> None:
+        """Close the connection after it has been idle for a while."""
+        self._idle_unsub = None
+        _LOGGER.debug("Closing idle connection to %s:%s", self.host, self.port)
+        self._close_connection()
+
+    async def _read_frame(self, reader: asyncio.StreamReader) -> bytes:
+        """Read the next reply frame, returning as soon as it is complete."""
+        while True:
+            frame = _split_frame(self._rx_buffer)
+            if frame is not None:
+                return frame
+
+            chunk = await reader.read(4096)
+            if not chunk:
+                # Device closed the connection, keep whatever it sent last
+                frame = bytes(self._rx_buffer).strip()
+                self._close_connection()
+                if not frame:
+                    raise ConnectionResetError("Connection closed by device")
+                return frame
+            self._rx_buffer += chunk
+
+    async def _discard_pending(self, reader: asyncio.StreamReader) -> bool:
+        """Drop leftover and unsolicited data so the next reply lines up.
+
+        Only reads what is already buffered, returns False if the device
+        has closed the connection in the meantime.
+        """
+        self._rx_buffer.clear()
+        try:
+            # read() returns at once while data is buffered, so the timeout
+            # only lands once it would have to wait for the device
+            async with asyncio.timeout(0):
+                while True:
+                    chunk = await reader.read(4096)
+                    if not chunk:
+                        return False
+                    _LOGGER.debug("Discarding unexpected data: %s", chunk)
+        except TimeoutError:
+            return True
+
+    async def _send_and_receive(self, payload: bytes, timeout: float = 3) -> bytes:
+        """Send payload over the persistent connection and return the reply.
+
+        If a reused connection turns out to be dead, reconnect once and retry.
+        Connecting has its own CONNECTION_TIMEOUT budget; an empty reply
+        means the hood did not answer within timeout after the write.
+        """
+        async with self._conn_lock:
+            for attempt in range(2):
+                reused = self._writer is not None
+                async with asyncio.timeout(CONNECTION_TIMEOUT):
+                    reader, writer = await self._ensure_connection()
+                if reused and not await self._discard_pending(reader):
+                    # Only a reused connection gets here, so this is attempt 0
+                    self._close_connection()
+                    _LOGGER.debug("Connection closed by device, reconnecting")
+                    continue
+                try:
+                    async with asyncio.timeout(timeout):
+                        writer.write(payload)
+                        # Small payloads normally go straight to the socket;
+                        # only wait for the buffer to drain if they did not
+                        if writer.transport.get_write_buffer_size():
+                            await writer.drain()
+                        response = await self._read_frame(reader)
+                except TimeoutError:
+                    # A partial reply may still be buffered, so the
+                    # stream can no longer be trusted to be in sync.
+                    # Caught first, TimeoutError is also an OSError
+                    response = b""
+                    self._close_connection()
+                except OSError:
+                    self._close_connection()
+                    if reused and attempt == 0:
+                        _LOGGER.debug("Stale connection, reconnecting")
+                        continue
+                    raise
+                break
+
+            if self._writer is not None:
+                if self._idle_unsub is not None:
+                    self._idle_unsub()
+                self._idle_unsub = async_call_later(
+                    self.hass, CONNECTION_IDLE_TIMEOUT, self._handle_idle_timeout
+                )
+            return response
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, closing the connection with the last one.
+
+        The base class already stops polling without listeners, so there is
+        no reason to keep the hood's only client slot taken either.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            if not self._listeners and self._writer is not None:
+                self.hass.async_create_task(self.async_close())
+
+        return remove
+
+    async def async_close(self) -> None:
+        """Close the persistent connection."""
+        async with self._conn_lock:
+            writer = self._writer
+            self._close_connection()
+        if writer is not None:
+            try:
+                # Close flushes unsent data first, which a dead hood
+                # would never accept, so don't wait for that forever
+                async with asyncio.timeout(1):
+                    await writer.wait_closed()
+            except TimeoutError:
+                writer.transport.abort()
+            except OSError:
+                pass
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, drop pending commands and close the connection."""
+        self._shutting_down = True
+        if self._send_task is not None:
+            self._send_task.cancel()
+            self._send_task = None
+        self._pending.clear()
+        await super().async_shutdown()
+        await self.async_close()
+
+    async def async_stop(self, _event: Event) -> None:
+        """Shut down when Home Assistant stops."""
+        await self.async_shutdown()
 
     async def _query_current_status(self) -> Dict[str, Any]:
-        """Query current status and return parsed data."""
+        """Query current status and return parsed data.
+
+        Callers arriving while a query is in flight share its result instead
+        of queueing another round trip behind the connection lock.
+        """
+        if self._status_task is None:
+            self._status_task = self.hass.async_create_task(self._fetch_status())
+            self._status_task.add_done_callback(self._clear_status_task)
+        return dict(await asyncio.shield(self._status_task))
+
+    @callback
+    def _clear_status_task(self, _task: asyncio.Task) -> None:
+        """Let the next refresh start a new status query."""
+        self._status_task = None
+
+    async def _fetch_status(self) -> Dict[str, Any]:
+        """Send one status query and return the parsed reply."""
         try:
             _LOGGER.debug("=== QUERYING STATUS ===")
             
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=10
-            )
-            
-            # Read initial "okidargb"
-            try:
-                initial = await asyncio.wait_for(reader.read(100), timeout=3)
-                initial_str = initial.decode().strip()
-                _LOGGER.debug("Initial response: %s", repr(initial_str))
-            except asyncio.TimeoutError:
-                _LOGGER.debug("No initial response")
-            
             # Send status query
-            status_cmd = '{"A":4}\r'
-            _LOGGER.debug("Sending status query: %s", repr(status_cmd))
-            writer.write(status_cmd.encode())
-            await writer.drain()
-            
-            # Read response
-            response = await asyncio.wait_for(reader.read(2048), timeout=5)
-            writer.close()
-            await writer.wait_closed()
+            _LOGGER.debug("Sending status query: %r", _STATUS_QUERY_BYTES)
+            response = await self._send_and_receive(_STATUS_QUERY_BYTES, timeout=5)
             
             if response:
-                response_str = response.decode().strip()
-                _LOGGER.debug("Status response: %s", repr(response_str))
+                _LOGGER.debug("Status response: %r", response)
                 
                 try:
-                    status_data = json.loads(response_str)
+                    status_data = _loads(response)
                     _LOGGER.debug("✓ Parsed status JSON: %s", status_data)
                     self._last_state.update(status_data)
                     return status_data
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     _LOGGER.warning("Cannot parse status JSON: %s", e)
             
             # Fallback to last known state
-            return self._last_state
+            return dict(self._last_state)
             
         except Exception as ex:
             _LOGGER.debug("Status query error: %s", ex)
             raise UpdateFailed(f"Failed to query status: {ex}")
 
     async def send_smart_command(self, changes: dict) -> bool:
+        """Queue changes and send them, merged with any others that follow.
+
+        Changes arriving within COMMAND_DEBOUNCE of each other (slider drags,
+        color wheel) are merged into a single command; all callers await the
+        same send.
+        """
+        self._pending.update(changes)
+        if self._send_task is None:
+            self._send_task = self.hass.async_create_task(
+                self._flush_after(COMMAND_DEBOUNCE)
+            )
+        return await asyncio.shield(self._send_task)
+
+    async def _flush_after(self, delay: float) -> bool:
+        """Wait for more changes, then send everything pending at once."""
+        await asyncio.sleep(delay)
+        batch, self._pending = self._pending, {}
+        self._send_task = None
+        return await self._send_changes(batch)
+
+    async def _send_changes(self, changes: dict) -> bool:
         """Send command with correct app-like parameters."""
         try:
-            _LOGGER.info("=== SMART COMMAND START ===")
-            _LOGGER.info("Changes requested: %s", changes)
+            _LOGGER.debug("=== SMART COMMAND START ===")
+            _LOGGER.debug("Changes requested: %s", changes)
             
             # Get current state
-            current_state = self.data or self._last_state
-            _LOGGER.info("Current coordinator data: %s", current_state)
-            
-            # Create new state with changes
-            new_state = current_state.copy()
-            new_state.update(changes)
+            current_state = self._known_state
+            _LOGGER.debug("Current coordinator data: %s", current_state)
             
-            # KORRIGIERT: App-konforme Werte für Control-Befehle!
+            # New state with changes, straight from the wire keys
             clean_state = {
-                "M": new_state.get("M", 1),
-                "L": new_state.get("L", 1), 
-                "R": new_state.get("R", 45),
-                "G": new_state.get("G", 255),
-                "B": new_state.get("B", 104),
-                "CW": new_state.get("CW", 110),
-                "BRG": new_state.get("BRG", 132),
-                "T": new_state.get("T", 0),
-                "TM": new_state.get("TM", 0),
-                "TS": 255,  # IMMER 255 wie in der App!
-                "A": 1      # IMMER 1 für Control-Befehle (nicht 4!)
+                key: changes[key] if key in changes
+                else current_state.get(key, _DEFAULT_STATE[key])
+                for key in _WIRE_KEYS
             }
-            
-            _LOGGER.info("Sending CORRECTED state: %s", clean_state)
-            
-            # Send command
-            command_str = json.dumps(clean_state) + '\r'
-            _LOGGER.info("CORRECTED Command string: %s", repr(command_str))
-            
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=10
-            )
-            
-            # Read initial "okidargb"
-            try:
-                initial = await asyncio.wait_for(reader.read(100), timeout=2)
-                _LOGGER.info("Initial response: %s", repr(initial.decode()))
-            except asyncio.TimeoutError:
-                _LOGGER.info("No initial response")
-            
-            # Send command
-            writer.write(command_str.encode())
-            await writer.drain()
-            _LOGGER.info("✓ Command sent")
-            
-            # Read response
-            try:
-                response = await asyncio.wait_for(reader.read(2048), timeout=3)
-                if response:
-                    response_str = response.decode().strip()
-                    _LOGGER.info("✓ Command response: %s", repr(response_str))
-                    
-                    # Try to parse and update our state
-                    try:
-                        response_data = json.loads(response_str)
-                        self._last_state.update(response_data)
-                        _LOGGER.info("✓ State updated from response")
-                    except json.JSONDecodeError:
-                        _LOGGER.debug("Response not JSON, assuming success")
-                        # Update our local state with the changes we sent
-                        self._last_state.update(changes)
-            except asyncio.TimeoutError:
-                _LOGGER.info("No command response (might be normal)")
-                # Update our local state with the changes we sent
+            clean_state.update(_CONTROL_VALUES)
+            
+            if self._supports_delta or (
+                self._supports_delta is None and self._echoes_state
+            ):
+                # Requested values and any that differ, plus the control flags
+                delta = {
+                    key: value
+                    for key, value in clean_state.items()
+                    if key in _CONTROL_FLAGS
+                    or key in changes
+                    or current_state.get(key) != value
+                }
+                response_data = await self._send_state(delta)
+                if self._supports_delta is None:
+                    # Probe once: the hood must echo the values we changed
+                    self._supports_delta = _is_echo(delta, response_data)
+                    _LOGGER.debug("Partial commands supported: %s", self._supports_delta)
+                    if not self._supports_delta:
+                        response_data = await self._send_state(clean_state)
+            else:
+                # The full app-conformant state, as the app sends it
+                response_data = await self._send_state(clean_state)
+                if not self._echoes_state and _is_echo(clean_state, response_data):
+                    self._echoes_state = True
+            
+            if response_data is not None:
+                # The hood echoed its new state, no need to query it again
+                self._last_state.update(response_data)
+                self.async_set_updated_data(dict(self._last_state))
+                _LOGGER.debug("✓ State updated from response")
+            else:
+                # No echo, publish what we sent and let the next poll correct drift
                 self._last_state.update(changes)
+                self.async_set_updated_data(dict(self._last_state))
             
-            writer.close()
-            await writer.wait_closed()
-            
-            # Force refresh after 1 second to see the change
-            await asyncio.sleep(1)
-            await self.async_request_refresh()
-            
-            _LOGGER.info("=== SMART COMMAND COMPLETED ===")
+            _LOGGER.debug("=== SMART COMMAND COMPLETED ===")
             return True
             
-        except Exception as ex:
-            _LOGGER.error("✗ Smart command failed: %s", ex, exc_info=True)
+        except (OSError, TimeoutError) as ex:
+            # Expected when the hood is unreachable, no traceback needed
+            _LOGGER.warning("✗ Smart command failed: %r", ex)
+            return False
+        except Exception:
+            _LOGGER.exception("✗ Unexpected error sending smart command")
             return False
 
+    def _encode_state(self, state: Dict[str, Any]) -> bytes:
+        """Serialize state from cached per-key JSON fragments.
+
+        Payloads seen before are returned as is, otherwise only keys whose
+        value changed since the last command are re-encoded.
+        """
+        cache_key = tuple(state.items())
+        payload = self._payload_cache.get(cache_key)
+        if payload is not None:
+            return payload
+
+        fragments = self._state_fragments
+        for key, value in state.items():
+            cached = fragments.get(key)
+            if cached is None or cached[0] != value:
+                # Strip the braces, leaving '"KEY":value'
+                fragments[key] = (value, _dumps({key: value})[1:-1])
+        payload = b"{" + b",".join(fragments[key][1] for key in state) + b"}" + _LINE_END
+
+        if len(self._payload_cache) >= _PAYLOAD_CACHE_SIZE:
+            self._payload_cache.clear()
+        self._payload_cache[cache_key] = payload
+        return payload
+
+    async def _send_state(self, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Send a control command and return the parsed reply, if any."""
+        _LOGGER.debug("Sending CORRECTED state: %s", state)
+
+        command_bytes = self._encode_state(state)
+        _LOGGER.debug("CORRECTED Command string: %r", command_bytes)
+
+        response = await self._send_and_receive(command_bytes)
+        _LOGGER.debug("✓ Command sent")
+
+        if not response:
+            _LOGGER.debug("No command response (might be normal)")
+            return None
+
+        _LOGGER.debug("✓ Command response: %r", response)
+        try:
+            response_data = _loads(response)
+        except ValueError:
+            _LOGGER.debug("Response not JSON, assuming success")
+            return None
+        if not isinstance(response_data, dict):
+            return None
+        return response_data
+
     async def send_minimal_command(self, changes: dict) -> bool:
         """Send only the changed values - TEST VERSION."""
-        try:
-            _LOGGER.info("=== MINIMAL COMMAND TEST: %s ===", changes)
-            
-            # Nur die Änderungen als JSON
-            command_str = json.dumps(changes) + '\r'
-            _LOGGER.info("Sending minimal: %s", repr(command_str))
-            
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=10
-            )
-            
-            # Read initial "okidargb"
-            try:
-                initial = await asyncio.wait_for(reader.read(100), timeout=2)
-                _LOGGER.info("Initial response: %s", repr(initial.decode()))
-            except asyncio.TimeoutError:
-                _LOGGER.info("No initial response")
-            
-            # Send command
-            writer.write(command_str.encode())
-            await writer.drain()
-            
-            # Read response
-            try:
-                response = await asyncio.wait_for(reader.read(2048), timeout=3)
-                if response:
-                    response_str = response.decode().strip()
-                    _LOGGER.info("✓ Minimal response: %s", repr(response_str))
-            except asyncio.TimeoutError:
-                _LOGGER.debug("No response to minimal command")
-            
-            writer.close()
-            await writer.wait_closed()
-            
-            # Force refresh
-            await asyncio.sleep(1)
-            await self.async_request_refresh()
-            return True
-            
-        except Exception as ex:
-            _LOGGER.error("✗ Minimal command failed: %s", ex)
-            return False
+        _LOGGER.debug("=== MINIMAL COMMAND TEST: %s ===", changes)
+        # Nur die Änderungen als JSON
+        return await self._send_payload(_dumps(changes) + _LINE_END, changes)
 
     async def send_exact_command(self, command_type: str) -> bool:
         """Send exact predefined commands."""
-        command_changes = {
-            "light_on": {"L": 2},
-            "light_off": {"L": 1}, 
-            "fan_off": {"M": 1},
-            "fan_speed_1": {"M": 2},
-            "fan_speed_2": {"M": 3},
-            "fan_speed_3": {"M": 4},
-            "fan_speed_4": {"M": 5},
-        }
-        
-        if command_type == "status_query":
-            await self.async_request_refresh()
-            return True
-        
-        if command_type in command_changes:
-            return await self.send_smart_command(command_changes[command_type])
-        
-        _LOGGER.error("Unknown command type: %s", command_type)
-        return False
+        return await self.send_exact_commands((command_type,))
+
+    async def send_exact_commands(self, command_types: Sequence[str]) -> bool:
+        """Send several predefined commands as a single command.
+
+        Later command types win where they touch the same key, e.g. a light
+        and a fan change from a scene go out in one write.
+        """
+        unknown = set(command_types).difference(_COMMAND_TYPES)
+        if unknown:
+            _LOGGER.error("Unknown command type: %s", ", ".join(sorted(unknown)))
+            return False
 
-    async def send_raw_command(self, command_str: str) -> bool:
-        """Send raw command string."""
+        changes: Dict[str, int] = {}
+        refresh = False
+        for command_type in command_types:
+            if command_type == "status_query":
+                refresh = True
+            else:
+                changes.update(_EXACT_COMMANDS[command_type])
+
+        result = True
+        if changes:
+            result = await self.send_smart_command(changes)
+        if refresh:
+            await self.async_request_refresh()
+        return result
+
+    async def send_raw_command(self, command_str: Union[str, bytes]) -> bool:
+        """Send raw command, adding the line ending if it is missing."""
+        _LOGGER.debug("=== RAW COMMAND: %r ===", command_str)
+        payload = command_str if isinstance(command_str, bytes) else command_str.encode()
+        if not payload.endswith(_LINE_END):
+            payload += _LINE_END
         try:
-            _LOGGER.info("=== RAW COMMAND: %s ===", repr(command_str))
-            
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port), timeout=10
-            )
-            
-            # Read initial "okidargb"
-            try:
-                initial = await asyncio.wait_for(reader.read(100), timeout=2)
-                _LOGGER.info("Initial response: %s", repr(initial.decode()))
-            except asyncio.TimeoutError:
-                _LOGGER.info("No initial response")
-            
-            # Send command
-            writer.write(command_str.encode())
-            await writer.drain()
-            
-            # Read response
+            changes = _loads(payload)
+        except ValueError:
+            changes = None
+        if not isinstance(changes, dict):
+            changes = None
+        return await self._send_payload(payload, changes)
+
+    async def _send_payload(
+        self, payload: bytes, changes: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Send payload as is and publish its effect.
+
+        Uses the state echoed by the hood if there is one, otherwise applies
+        changes optimistically. Only refreshes when neither is known.
+        """
+        try:
+            response = await self._send_and_receive(payload)
+            if response:
+                _LOGGER.debug("✓ Response: %r", response)
+            else:
+                _LOGGER.debug("No command response")
+
             try:
-                response = await asyncio.wait_for(reader.read(2048), timeout=3)
-                if response:
-                    response_str = response.decode().strip()
-                    _LOGGER.info("✓ Raw response: %s", repr(response_str))
-            except asyncio.TimeoutError:
-                _LOGGER.info("No raw command response")
-            
-            writer.close()
-            await writer.wait_closed()
-            
-            # Force refresh
-            await asyncio.sleep(1)
-            await self.async_request_refresh()
+                response_data = _loads(response) if response else None
+            except ValueError:
+                response_data = None
+
+            if isinstance(response_data, dict):
+                self._last_state.update(response_data)
+            elif changes and any(key in changes for key in _WIRE_KEYS):
+                # Only state keys say what changed, control flags alone
+                # (e.g. a {"A":4} query) leave the effect unknown
+                self._last_state.update(
+                    (key, value)
+                    for key, value in changes.items()
+                    if key not in _CONTROL_FLAGS
+                )
+            else:
+                await self.async_request_refresh()
+                return True
+            self.async_set_updated_data(dict(self._last_state))
             return True
             
-        except Exception as ex:
-            _LOGGER.error("✗ Raw command failed: %s", ex)
+        except (OSError, TimeoutError) as ex:
+            _LOGGER.warning("✗ Command %r failed: %r", payload, ex)
+            return False
+        except Exception:
+            _LOGGER.exception("✗ Unexpected error sending command %r", payload)
             return False
 
+    def update_interval_seconds(self) -> int:
+        """Return the polling interval in seconds."""
+        return int(self.update_interval.total_seconds())
+
+    @property
+    def _known_state(self) -> Dict[str, Any]:
+        """Return the latest coordinator data, or the last known state."""
+        return self.data if self.data is not None else self._last_state
+
     @property
-    def current_state(self) -> Dict[str, Any]:
-        """Return current state for backward compatibility."""
-        return self.data or self._last_state
\ No newline at end of file
+    def current_state(self) -> Mapping[str, Any]:
+        """Return a read-only view of the current state."""
+        state = self._known_state
+        if state is not self._state_view_source:
+            self._state_view_source = state
+            self._state_view = MappingProxyType(state)
+        return self._state_view
\ No newline at end of file
@@ -18,10 +18,17 @@ from .const import (
     MIN_UPDATE_INTERVAL,
     MAX_UPDATE_INTERVAL,
     DEVICE_IDENTIFIER,
+    CMD_LINE_ENDING,
+    STATUS_QUERY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Compact, byte for byte the query the coordinator sends
+_STATUS_QUERY_BYTES = (
+    json.dumps(STATUS_QUERY, separators=(",", ":")) + CMD_LINE_ENDING
+).encode()
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -37,42 +44,52 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
 
     try:
         # Test connection
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_connection(host, port), timeout=10
-        )
-        
-        # Read initial response (should be "okidargb")
-        response = await asyncio.wait_for(reader.read(100), timeout=5)
-        response_str = response.decode().strip()
-        
-        _LOGGER.debug("Received initial response: %s", response_str)
-        
-        # Check if we get the expected device identifier
-        if DEVICE_IDENTIFIER not in response_str:
-            _LOGGER.warning("Unexpected device response: %s", response_str)
-        
-        # Try to send a status query
-        test_command = json.dumps({"A": 4}) + '\n'
-        writer.write(test_command.encode())
-        await writer.drain()
-        
-        # Try to read status response
+        async with asyncio.timeout(10):
+            reader, writer = await asyncio.open_connection(host, port)
+
         try:
-            status_response = await asyncio.wait_for(reader.read(1024), timeout=3)
-            if status_response:
-                status_str = status_response.decode().strip()
-                _LOGGER.debug("Status response: %s", status_str)
-                # Try to parse as JSON
-                try:
-                    json.loads(status_str)
-                except json.JSONDecodeError:
-                    _LOGGER.debug("Status response is not JSON, might be normal")
-        except asyncio.TimeoutError:
-            _LOGGER.debug("No status response received, might be normal")
-        
-        writer.close()
-        await writer.wait_closed()
-        
+            # Query right away, the initial "okidargb" and the status reply
+            # are then read together, up to the end of the JSON object
+            writer.write(_STATUS_QUERY_BYTES)
+            await writer.drain()
+
+            response = b""
+            try:
+                async with asyncio.timeout(3):
+                    while b"}" not in response:
+                        chunk = await reader.read(256)
+                        if not chunk:
+                            break
+                        response += chunk
+            except asyncio.TimeoutError:
+                _LOGGER.debug("No complete status response received")
+        finally:
+            # The probe is done, no need to hold up the form for the FIN handshake
+            writer.close()
+
+        _LOGGER.debug("Received response: %r", response)
+
+        # Check if we get the expected device identifier
+        has_banner = DEVICE_IDENTIFIER.encode() in response
+        if not has_banner:
+            _LOGGER.warning("Unexpected device response: %r", response)
+
+        # Try to parse the status as JSON, straight from the bytes
+        status_start = response.find(b"{")
+        has_status = False
+        if status_start != -1:
+            try:
+                json.loads(response[status_start:response.rfind(b"}") + 1])
+                has_status = True
+            except json.JSONDecodeError:
+                _LOGGER.debug("Status response is not JSON, might be normal")
+
+        if not has_banner and not has_status:
+            raise CannotConnect
+
+    except CannotConnect:
+        _LOGGER.error("No Silverline Hood answering on %s:%s", host, port)
+        raise
     except asyncio.TimeoutError:
         _LOGGER.error("Timeout connecting to %s:%s", host, port)
         raise CannotConnect
@@ -158,18 +175,6 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         options_schema = vol.Schema(
             {
-                vol.Required(
-                    CONF_HOST,
-                    default=self.config_entry.options.get(
-                        CONF_HOST, self.config_entry.data.get(CONF_HOST)
-                    ),
-                ): str,
-                vol.Required(
-                    CONF_PORT,
-                    default=self.config_entry.options.get(
-                        CONF_PORT, self.config_entry.data.get(CONF_PORT)
-                    ),
-                ): int,
                 vol.Required(
                     CONF_UPDATE_INTERVAL,
                     default=current_interval,
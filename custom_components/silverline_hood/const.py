@@ -1,7 +1,7 @@
 """Constants for the Silverline Hood integration."""
 DOMAIN = "silverline_hood"
 DEFAULT_PORT = 8555
-DEFAULT_UPDATE_INTERVAL = 10  # Diese Zeile fehlte!
+DEFAULT_UPDATE_INTERVAL = 30  # Diese Zeile fehlte!
 
 CONF_HOST = "host"
 CONF_PORT = "port"
@@ -37,7 +37,7 @@ MOTOR_SPEED_2 = 3
 MOTOR_SPEED_3 = 4
 MOTOR_SPEED_4 = 5
 
-SPEED_LIST = ["off", "low", "medium", "high", "max"]
+SPEED_LIST = ("off", "low", "medium", "high", "max")
 
 # Status query command
 STATUS_QUERY = {"A": 4}
@@ -46,4 +46,14 @@ CMD_LINE_ENDING = '\r'
 
 # Update interval constraints
 MIN_UPDATE_INTERVAL = 5  # seconds
-MAX_UPDATE_INTERVAL = 300  # seconds
\ No newline at end of file
+MAX_UPDATE_INTERVAL = 300  # seconds
+
+# Persistent connection
+CONNECTION_TIMEOUT = 10  # seconds, a hood rejoining WiFi can be slow
+CACHED_ADDRESS_TIMEOUT = 3  # seconds, before resolving the host again
+CONNECTION_IDLE_TIMEOUT = 300  # seconds
+CONNECTION_KEEPALIVE = 30  # seconds
+HOST_RESOLVE_TTL = 300  # seconds
+
+# Commands arriving within this window are merged into one
+COMMAND_DEBOUNCE = 0.05  # seconds
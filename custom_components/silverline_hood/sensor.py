@@ -34,21 +34,10 @@ async def async_setup_entry(
     """Set up Silverline Hood sensors."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     
-    sensors = [
-        SilverlineHoodWifiSSIDSensor(coordinator),
-        SilverlineHoodWifiModeSensor(coordinator),
-        SilverlineHoodWifiAPSSIDSensor(coordinator),
-        SilverlineHoodTemperatureSensor(coordinator),
-        SilverlineHoodTimerSensor(coordinator, "TM", "Timer TM"),
-        SilverlineHoodTimerSensor(coordinator, "TS", "Timer TS"),
-        SilverlineHoodStatusSensor(coordinator, "U", "Status U"),
-        SilverlineHoodLightModeSensor(coordinator),
-        SilverlineHoodDirectionSensor(coordinator, "CWD", "Cold White Direction"),
-        SilverlineHoodDirectionSensor(coordinator, "RGBD", "RGB Direction"),
-    ]
+    sensors = [sensor_class(coordinator, *args) for sensor_class, *args in _SENSORS]
     
-    async_add_entities(sensors, True)
-    _LOGGER.info("Added %d Silverline Hood sensors", len(sensors))
+    async_add_entities(sensors)
+    _LOGGER.debug("Added %d Silverline Hood sensors", len(sensors))
 
 
 class SilverlineHoodBaseSensor(SensorEntity):
@@ -59,23 +48,11 @@ class SilverlineHoodBaseSensor(SensorEntity):
         self._coordinator = coordinator
         self._sensor_type = sensor_type
         self._attr_name = f"Silverline Hood {name}"
-        self._attr_unique_id = f"{coordinator.host}_{coordinator.port}_{sensor_type.lower()}"
+        self._attr_unique_id = f"{coordinator.device_id}_{sensor_type.lower()}"
         self._attr_should_poll = False
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, f"{self._coordinator.host}_{self._coordinator.port}")},
-            "name": "Silverline Hood",
-            "manufacturer": "Silverline",
-            "model": "Smart Hood",
-        }
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+        self._attr_device_info = coordinator.device_info
+        # Always available, read as a plain attribute on every state write
+        self._attr_available = True
 
 
 class SilverlineHoodWifiSSIDSensor(SilverlineHoodBaseSensor):
@@ -95,6 +72,13 @@ class SilverlineHoodWifiSSIDSensor(SilverlineHoodBaseSensor):
 class SilverlineHoodWifiModeSensor(SilverlineHoodBaseSensor):
     """WiFi Mode sensor."""
 
+    # Translate common modes
+    _MODE_MAP = {
+        "STA": "Station",
+        "AP": "Access Point",
+        "AP_STA": "Mixed Mode"
+    }
+
     def __init__(self, coordinator):
         """Initialize the sensor."""
         super().__init__(coordinator, "wifi_mode", "WiFi Mode")
@@ -104,13 +88,7 @@ class SilverlineHoodWifiModeSensor(SilverlineHoodBaseSensor):
     def native_value(self) -> Optional[str]:
         """Return the WiFi mode."""
         mode = self._coordinator.current_state.get(CMD_WIFI_MODE, "Unknown")
-        # Translate common modes
-        mode_map = {
-            "STA": "Station",
-            "AP": "Access Point", 
-            "AP_STA": "Mixed Mode"
-        }
-        return mode_map.get(mode, mode)
+        return self._MODE_MAP.get(mode, mode)
 
 
 class SilverlineHoodWifiAPSSIDSensor(SilverlineHoodBaseSensor):
@@ -151,7 +129,7 @@ class SilverlineHoodTimerSensor(SilverlineHoodBaseSensor):
 
     def __init__(self, coordinator, timer_key: str, name: str):
         """Initialize the sensor."""
-        super().__init__(coordinator, timer_key.lower(), name)
+        super().__init__(coordinator, timer_key, name)
         self._timer_key = timer_key
         self._attr_icon = "mdi:timer"
         self._attr_native_unit_of_measurement = "min"
@@ -167,7 +145,7 @@ class SilverlineHoodStatusSensor(SilverlineHoodBaseSensor):
 
     def __init__(self, coordinator, status_key: str, name: str):
         """Initialize the sensor."""
-        super().__init__(coordinator, status_key.lower(), name)
+        super().__init__(coordinator, status_key, name)
         self._status_key = status_key
         self._attr_icon = "mdi:information"
 
@@ -180,6 +158,13 @@ class SilverlineHoodStatusSensor(SilverlineHoodBaseSensor):
 class SilverlineHoodLightModeSensor(SilverlineHoodBaseSensor):
     """Light mode sensor."""
 
+    _MODE_MAP = {
+        0: "Normal",
+        1: "Breathing",
+        2: "Strobe",
+        3: "Fade"
+    }
+
     def __init__(self, coordinator):
         """Initialize the sensor."""
         super().__init__(coordinator, "light_mode", "Light Mode")
@@ -189,21 +174,21 @@ class SilverlineHoodLightModeSensor(SilverlineHoodBaseSensor):
     def native_value(self) -> Optional[str]:
         """Return the light mode."""
         mode = self._coordinator.current_state.get(CMD_LIGHT_MODE, 0)
-        mode_map = {
-            0: "Normal",
-            1: "Breathing", 
-            2: "Strobe",
-            3: "Fade"
-        }
-        return mode_map.get(mode, f"Mode {mode}")
+        return self._MODE_MAP.get(mode, f"Mode {mode}")
 
 
 class SilverlineHoodDirectionSensor(SilverlineHoodBaseSensor):
     """Direction sensor."""
 
+    _DIRECTION_MAP = {
+        0: "Off",
+        1: "Forward",
+        2: "Reverse"
+    }
+
     def __init__(self, coordinator, direction_key: str, name: str):
         """Initialize the sensor."""
-        super().__init__(coordinator, direction_key.lower(), name)
+        super().__init__(coordinator, direction_key, name)
         self._direction_key = direction_key
         self._attr_icon = "mdi:arrow-right"
 
@@ -211,12 +196,7 @@ class SilverlineHoodDirectionSensor(SilverlineHoodBaseSensor):
     def native_value(self) -> Optional[str]:
         """Return the direction."""
         direction = self._coordinator.current_state.get(self._direction_key, 0)
-        direction_map = {
-            0: "Off",
-            1: "Forward",
-            2: "Reverse"
-        }
-        return direction_map.get(direction, f"Direction {direction}")
+        return self._DIRECTION_MAP.get(direction, f"Direction {direction}")
 
 
 # Zusätzlicher WiFi Signal Sensor (falls verfügbar)
@@ -240,4 +220,19 @@ class SilverlineHoodSignalStrengthSensor(SilverlineHoodBaseSensor):
             return rssi
         
         # Alternative: aus anderen Daten ableiten oder Status-Query erweitern
-        return None
\ No newline at end of file
+        return None
+
+
+# Sensors set up for each hood, in order: class, then its extra arguments
+_SENSORS = (
+    (SilverlineHoodWifiSSIDSensor,),
+    (SilverlineHoodWifiModeSensor,),
+    (SilverlineHoodWifiAPSSIDSensor,),
+    (SilverlineHoodTemperatureSensor,),
+    (SilverlineHoodTimerSensor, "TM", "Timer TM"),
+    (SilverlineHoodTimerSensor, "TS", "Timer TS"),
+    (SilverlineHoodStatusSensor, "U", "Status U"),
+    (SilverlineHoodLightModeSensor,),
+    (SilverlineHoodDirectionSensor, "CWD", "Cold White Direction"),
+    (SilverlineHoodDirectionSensor, "RGBD", "RGB Direction"),
+)